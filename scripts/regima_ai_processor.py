@@ -9,405 +9,404 @@ to generate AI-powered insights and recommendations for RegimA's development cyc
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property, partial
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Final, Optional, Sequence, Tuple
 import logging
+import mmap
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Config files at least this large are memory-mapped rather than read into a copy
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_json_file(path: Path) -> Any:
+    """Parse a JSON file, memory-mapping large files when orjson can parse the mapping in place."""
+    with open(path, 'rb') as f:
+        if orjson is None or os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            return _json_loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _write_file(path: str, chunks: Sequence[bytes]) -> None:
+    """Write chunks to path in order, replacing any existing file, in as few write calls as possible."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        if hasattr(os, 'writev'):
+            # Scatter-gather write avoids joining large bodies onto their headers
+            written = os.writev(fd, chunks)
+            if written == sum(len(chunk) for chunk in chunks):
+                return
+            view = memoryview(b"".join(chunks))[written:]
+        else:
+            view = memoryview(b"".join(chunks))
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Analysis kinds produced by generate_analysis, in output order
+_ANALYSIS_KEYS: Final[Tuple[str, ...]] = tuple(
+    sys.intern(key) for key in ('zone_concept', 'consciousness', 'guidance', 'comprehensive')
+)
+_ZONE_CONCEPT, _CONSCIOUSNESS, _GUIDANCE, _COMPREHENSIVE = _ANALYSIS_KEYS
+
+# Analysis kinds generated for each ANALYSIS_TYPE
+_ANALYSIS_PLANS: Final[Dict[str, Tuple[str, ...]]] = {
+    'full': _ANALYSIS_KEYS,
+    'zone_concept_only': (_ZONE_CONCEPT,),
+    'consciousness_only': (_CONSCIOUSNESS,),
+    'guidance_only': (_GUIDANCE,),
+}
+
+# Instruction that opens the AI prompt for each analysis kind
+_ANALYSIS_INSTRUCTIONS: Final[Dict[str, str]] = {
+    _ZONE_CONCEPT: "Analyze the Zone Concept framework and provide strategic recommendations.",
+    _CONSCIOUSNESS: "Analyze the organizational consciousness evolution and provide development insights.",
+    _GUIDANCE: "Analyze the professional guidance framework and provide enhancement recommendations.",
+    _COMPREHENSIVE: "Provide a comprehensive analysis of the RegimA organizational learning cycle.",
+}
+
+# Title-cased forms of the analysis kinds and Zone Concept core elements
+_TITLED: Final[Dict[str, str]] = {
+    key: key.title()
+    for key in (
+        *_ANALYSIS_KEYS,
+        'antiInflammatory', 'antiOxidants', 'rejuvenation', 'integration',
+    )
+}
+
+
+def _title(key: str) -> str:
+    """Title-case a key, using the precomputed form when it is known."""
+    titled = _TITLED.get(key)
+    return titled if titled is not None else key.title()
+
+
+# Prompt context opening, followed by one section per Zone Concept core element
+_CONTEXT_HEADER_TEMPLATE: Final[str] = """
+# RegimA Organizational Learning Cycle Context
+
+## Current Organizational State
+- **Consciousness Level**: {consciousness_level}
+- **Evolution Level**: {evolution_level}
+- **Cycle Status**: {cycle_status}
+
+## Zone Concept Framework
+### Core Elements:
+"""
+
+# Prompt context section for a single Zone Concept core element
+_ELEMENT_TEMPLATE: Final[str] = (
+    "\n**{name}**:\n"
+    "- Relevance: {relevance}/10\n"
+    "- Focus: {focus}\n"
+    "- Key Technologies: {technologies}\n"
+)
+
+# Canned responses returned by the mock AI backend, stored as markdown resources
+_RESPONSES_DIR = Path(__file__).parent / "responses"
+
+
+def _load_response(name: str) -> str:
+    """Load a canned mock AI response from the responses directory."""
+    return (_RESPONSES_DIR / f"{name}.md").read_text(encoding='utf-8')
+
+
+_ZONE_CONCEPT_RESPONSE: Final[str] = _load_response(_ZONE_CONCEPT)
+_CONSCIOUSNESS_RESPONSE: Final[str] = _load_response(_CONSCIOUSNESS)
+_GUIDANCE_RESPONSE: Final[str] = _load_response(_GUIDANCE)
+_COMPREHENSIVE_RESPONSE: Final[str] = _load_response(_COMPREHENSIVE)
+
+# Summary document sections before and after the list of generated analyses
+_SUMMARY_HEADER_TEMPLATE: Final[str] = """# RégimA Professional Excellence AI Analysis Summary
+
+**Generated:** {generated_at}
+**Analysis Type:** {analysis_type}
+
+## Professional Development Status
+
+### Advanced Organizational State
+- **Professional Level:** {consciousness_level}
+- **Development Stage:** {evolution_level}
+- **Cycle Status:** {cycle_status}
+
+### Professional Framework Status
+- **Zone Concept Evolution:** Advanced three-pillar framework with professional integration (Version 2.0.0)
+- **Professional Guidance:** Evidence-based capabilities with treatment optimization
+- **Innovation Ecosystem:** Established with advanced professional technology integration
+- **Professional Impact:** Advanced education systems operational
+
+### Analysis Components Generated
+"""
+
+_SUMMARY_FOOTER: Final[str] = """
+### Professional Next Steps
+Based on the comprehensive professional analysis, RégimA should focus on:
+
+1. **Advanced Professional Actions**: Develop next-generation Zone Concept applications with evidence-based personalization
+2. **Professional Excellence Development**: Advance expertise evolution toward comprehensive professional leadership
+3. **Innovation Excellence**: Establish evidence-based research systems for continuous advancement
+4. **Industry Leadership**: Deploy professional education systems and industry advancement initiatives
+
+### Professional Capabilities Achieved
+- Evidence-based predictive treatment protocols operational
+- Professional development networks established and growing
+- Innovation ecosystem with continuous evidence-based research active
+- Industry impact orientation with advanced professional technology deployment successful
+
+### Files Generated
+- Individual professional analysis files for each excellence component
+- Comprehensive JSON output with advanced analytics for programmatic access
+- This professional summary for strategic review
+
+For detailed professional insights, refer to the individual analysis files in the outputs directory.
+"""
+
+
 class RegimAAIProcessor:
     """AI processor for RegimA organizational learning cycle data."""
     
-    def __init__(self):
+    # Canned response for each analysis kind, used by the mock backend
+    _MOCK_RESPONSES: Dict[str, str] = {
+        _ZONE_CONCEPT: _ZONE_CONCEPT_RESPONSE,
+        _CONSCIOUSNESS: _CONSCIOUSNESS_RESPONSE,
+        _GUIDANCE: _GUIDANCE_RESPONSE,
+        _COMPREHENSIVE: _COMPREHENSIVE_RESPONSE,
+    }
+    
+    def __init__(self) -> None:
+        # Configuration files are loaded and the outputs directory created on first use
         self.base_path = Path(__file__).parent.parent
         self.outputs_dir = self.base_path / "outputs"
-        self.outputs_dir.mkdir(exist_ok=True)
-        
-        # Load configuration data
-        self.regcyc_data = self._load_json_file("regcyc.json")
-        self.cycle_completion_data = self._load_json_file("cycleCompletion.json")
         
         # Analysis type from environment or default
         self.analysis_type = os.getenv('ANALYSIS_TYPE', 'full')
+
+        # Sends a prompt to an AI provider and returns its response. No provider
+        # client is wired in yet, so every analysis uses the canned responses
+        # and the full prompts never need to be assembled.
+        self._ai_client: Optional[Callable[[str], str]] = None
+    
+    @cached_property
+    def regcyc_data(self) -> Dict[str, Any]:
+        """Organizational learning cycle data from regcyc.json."""
+        return self._load_json_file("regcyc.json")
+    
+    @cached_property
+    def cycle_completion_data(self) -> Dict[str, Any]:
+        """Cycle completion data from cycleCompletion.json."""
+        return self._load_json_file("cycleCompletion.json")
+    
+    # Top-level regcyc sections referenced throughout the analysis
+    @cached_property
+    def _consciousness(self) -> Dict[str, Any]:
+        return self.regcyc_data.get('organizationalConsciousness') or {}
+    
+    @cached_property
+    def _cycle(self) -> Dict[str, Any]:
+        return self.regcyc_data.get('cycleCompletion') or {}
+    
+    @cached_property
+    def _framework(self) -> Dict[str, Any]:
+        return self.regcyc_data.get('zoneConceptFramework') or {}
+    
+    @cached_property
+    def _guidance(self) -> Dict[str, Any]:
+        return self.regcyc_data.get('professionalGuidance') or {}
+    
+    @cached_property
+    def _state_fields(self) -> Dict[str, Any]:
+        """Organizational state values shared by the prompt context and summary templates."""
+        return {
+            'consciousness_level': self._consciousness.get('currentState', 'N/A'),
+            'evolution_level': self._consciousness.get('evolutionLevel', 'N/A'),
+            'cycle_status': self._cycle.get('status', 'N/A'),
+        }
         
     def _load_json_file(self, filename: str) -> Dict[str, Any]:
         """Load JSON data from file."""
         file_path = self.base_path / filename
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            data = _read_json_file(file_path)
         except FileNotFoundError:
-            logger.error(f"File {filename} not found at {file_path}")
+            logger.error("File %s not found at %s", filename, file_path)
             return {}
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing {filename}: {e}")
+        except ValueError as e:
+            logger.error("Error parsing %s: %s", filename, e)
             return {}
+        if not isinstance(data, dict):
+            logger.error("Error parsing %s: expected a JSON object", filename)
+            return {}
+        return data
     
-    def _generate_prompt_context(self) -> str:
-        """Generate context for AI prompts based on organizational data."""
-        context = f"""
-# RegimA Organizational Learning Cycle Context
-
-## Current Organizational State
-- **Consciousness Level**: {self.regcyc_data.get('organizationalConsciousness', {}).get('currentState', 'N/A')}
-- **Evolution Level**: {self.regcyc_data.get('organizationalConsciousness', {}).get('evolutionLevel', 'N/A')}
-- **Cycle Status**: {self.regcyc_data.get('cycleCompletion', {}).get('status', 'N/A')}
-
-## Zone Concept Framework
-### Core Elements:
-"""
+    @cached_property
+    def _prompt_context(self) -> str:
+        """Context for AI prompts based on organizational data, built once per processor."""
+        parts: List[str] = [_CONTEXT_HEADER_TEMPLATE.format_map(self._state_fields)]
         
         # Add Zone Concept core elements
-        core_elements = self.regcyc_data.get('zoneConceptFramework', {}).get('coreElements', {})
+        core_elements = self._framework.get('coreElements') or {}
         for element, details in core_elements.items():
-            context += f"\n**{element.title()}**:\n"
-            context += f"- Relevance: {details.get('relevance', 'N/A')}/10\n"
-            context += f"- Focus: {details.get('focus', 'N/A')}\n"
-            context += f"- Key Technologies: {', '.join(details.get('keyTechnologies', []))}\n"
+            details = details or {}
+            parts.append(_ELEMENT_TEMPLATE.format_map({
+                'name': _title(element),
+                'relevance': details.get('relevance', 'N/A'),
+                'focus': details.get('focus', 'N/A'),
+                'technologies': ', '.join(details.get('keyTechnologies') or []),
+            }))
         
         # Add professional guidance areas
-        context += "\n## Professional Guidance Focus Areas:\n"
-        focus_areas = self.regcyc_data.get('professionalGuidance', {}).get('focusAreas', [])
-        for area in focus_areas:
-            context += f"- {area}\n"
+        parts.append("\n## Professional Guidance Focus Areas:\n")
+        focus_areas = self._guidance.get('focusAreas') or []
+        parts.extend(f"- {area}\n" for area in focus_areas)
         
         # Add cycle completion insights
-        context += "\n## Current Cycle Insights:\n"
-        insights = self.regcyc_data.get('cycleCompletion', {}).get('insights', [])
-        for insight in insights:
-            context += f"- {insight}\n"
+        parts.append("\n## Current Cycle Insights:\n")
+        insights = self._cycle.get('insights') or []
+        parts.extend(f"- {insight}\n" for insight in insights)
         
-        return context
-    
-    def _generate_mock_ai_response(self, prompt: str, model_type: str = "openai") -> str:
-        """Generate mock AI response (since we don't have real API keys in this environment)."""
-        context = self._generate_prompt_context()
-        
-        # Mock responses based on analysis type and prompt content
-        if "zone concept" in prompt.lower():
-            return self._generate_zone_concept_response()
-        elif "consciousness" in prompt.lower():
-            return self._generate_consciousness_response()
-        elif "guidance" in prompt.lower():
-            return self._generate_guidance_response()
-        else:
-            return self._generate_comprehensive_response()
+        return "".join(parts)
     
-    def _generate_zone_concept_response(self) -> str:
-        """Generate response focused on Zone Concept framework."""
-        return """
-## Advanced Zone Concept Framework Analysis
-
-### Professional Zone Framework Assessment
-The Zone Concept framework demonstrates advanced integration across all three core elements with evidence-based professional protocols:
-
-**Anti-Inflammatory Excellence (Relevance: 9/10)**
-- Beta-Endorphin Stimulator technology producing sense of wellbeing and reducing inflammation response
-- Advanced anti-inflammatory plant complexes (Bisabolol, Centella Asiatica, Enhanced Plant Extract Complex) 
-- Professional protocols for managing sensitive skin conditions and inflammatory responses
-- Evidence-based treatment combinations for rosacea, sensitive skin, and problem skin conditions
-- Specialized formulations with clinically effective concentrations for optimal anti-inflammatory action
-- Recommendation: Expand professional training in anti-inflammatory protocol application and sensitive skin management
-
-**Anti-Oxidant Protection Systems (Relevance: 9/10)**
-- Advanced UV Filter Technology (Uvinul A Plus, Tinosorb S, Uvinul T150) providing superior photostable protection
-- 24-Hour Chronoactive antioxidant systems offering continuous free radical defense during day and night
-- Professional-grade environmental protection against pollution, urban stress, and oxidative damage
-- Evidence-based antioxidant combinations with Vitamins C, E, and plant-derived protective complexes
-- Recommendation: Develop advanced environmental protection protocols and expand UV education programs
-
-**Rejuvenation Professional Protocols (Relevance: 10/10)**
-- Professional Peptide Technology including Matrixyl 3000 for advanced collagen synthesis and wrinkle reduction
-- Alpha Hydroxy Acid systems (Power Peels 30 & 50) for professional resurfacing and cellular renewal
-- Advanced regenerative ingredients supporting natural skin repair and anti-aging processes
-- Evidence-based treatment protocols combining professional procedures with specialized home care systems
-- Recommendation: Expand professional treatment training and develop advanced anti-aging protocol certifications
-
-**Integration Professional Framework (Relevance: 10/10)**
-- Synergistic formulations combining anti-inflammatory, antioxidant, and regenerative ingredients for optimal efficacy
-- Professional treatment protocols integrating all Zone elements for comprehensive skin health management
-- Personalized skincare programs based on professional skin analysis and individual client needs assessment
-- Evidence-based treatment combinations ensuring maximum therapeutic benefit and client satisfaction
-- Recommendation: Establish comprehensive Zone integration training and develop advanced consultation methodologies
-
-### Professional Development Recommendations
-1. **Enhanced Training Programs**: Develop comprehensive Zone Concept education with hands-on application training
-2. **Professional Certification**: Establish advanced certification programs for Zone Concept specialists and treatment experts
-3. **Evidence-Based Protocols**: Create detailed treatment guidelines based on clinical outcomes and professional best practices
-4. **Advanced Consultation Skills**: Develop professional consultation methodologies incorporating Zone analysis and personalized treatment planning
-5. **Continuous Education**: Establish ongoing professional development programs ensuring current knowledge and technique advancement
-"""
-    
-    def _generate_consciousness_response(self) -> str:
-        """Generate response focused on organizational consciousness."""
-        return """
-## Professional Organizational Excellence Analysis
-
-### Advanced Professional Development State
-The organizational expertise has achieved **"Advanced Zone Concept Integration with Professional Excellence"** representing significant advancement:
-
-- **Zone Concept Mastery**: Comprehensive understanding and application of Zone Concept principles with evidence-based treatment protocols
-- **Professional Excellence**: Advanced professional standards with specialized training programs and certification systems
-- **Evidence-Based Practice**: Professional expertise enhanced with clinical research, ingredient science, and proven treatment outcomes
-- **Adaptive Professional Capabilities**: Advanced ability to handle complex skin conditions and customize treatments based on individual client needs
-- **Industry Recognition**: Professional standing enhanced through advanced protocols, specialist education, and evidence-based practice leadership
-- **Knowledge Distribution**: Comprehensive education systems for professional development and continuous competency advancement
-
-### Professional Evolution Trajectory
-The progression to advanced professional excellence represents:
-
-1. **Evidence-Based Expertise**: Development of professional capabilities based on clinical research, ingredient science, and proven treatment methodologies
-2. **Advanced Treatment Protocols**: Professional expertise enhanced with specialized techniques, advanced product applications, and personalized treatment planning
-3. **Comprehensive Education Systems**: Professional development expanded to include comprehensive training programs, certification systems, and continuous learning opportunities
-4. **Specialized Professional Capabilities**: Advanced ability to handle complex cases, customize treatments, and optimize client outcomes through evidence-based practice
-5. **Industry Leadership**: Professional recognition and leadership through advanced protocols, specialist education programs, and professional excellence standards
-
-### Professional Development Recommendations
-1. **Advanced Training Programs**: Develop comprehensive professional education with specialized Zone Concept application and evidence-based treatment protocols
-2. **Certification Excellence**: Create advanced certification systems for professional competency assessment and ongoing skill development
-3. **Professional Networks**: Establish comprehensive professional development systems with peer collaboration, knowledge sharing, and continuous learning opportunities
-4. **Evidence-Based Practice**: Enhance professional capabilities through clinical research integration, outcome assessment, and continuous protocol refinement
-5. **Industry Leadership**: Advance professional recognition through specialist education programs, advanced treatment protocols, and evidence-based excellence standards
-"""
+    def _generate_ai_response(self, client: Callable[[str], str], kind: str) -> str:
+        """Request an analysis of the given kind from the AI provider client."""
+        return client(f"{_ANALYSIS_INSTRUCTIONS[kind]} Context: {self._prompt_context}")
     
-    def _generate_guidance_response(self) -> str:
-        """Generate response focused on professional guidance."""
-        return """
-## Professional Guidance Enhancement Analysis
-
-### Advanced Professional Focus Areas Assessment
-The professional guidance framework demonstrates comprehensive coverage with evidence-based excellence:
-
-**Zone Concept Professional Application**
-- Advanced implementation of evidence-based treatment protocols with personalized skincare programs
-- Professional diagnostic capabilities and comprehensive skin analysis systems
-- Specialized treatment customization based on individual client needs and professional assessment
-
-**Professional Education Excellence**
-- Comprehensive educational methodologies with hands-on training and practical skill development
-- Advanced competency assessment systems and professional certification programs
-- Continuous learning programs with peer collaboration and knowledge sharing networks
-
-**Client Outcome Optimization through Professional Consultation**
-- Evidence-based treatment planning and outcome monitoring systems
-- Personalized skincare programs with professional guidance and ongoing support
-- Advanced client assessment techniques and treatment customization capabilities
-
-**Organizational Professional Development**
-- Advanced professional standards and continuous improvement systems
-- Comprehensive training programs and professional development networks
-- Industry leadership through evidence-based practice and professional excellence
-
-**Innovation Leadership in Professional Skincare**
-- Advanced treatment technology integration and evidence-based protocol development
-- Industry-leading professional applications and specialized treatment advancement
-- Professional impact through advanced protocols and specialist education programs
-
-### Professional Implementation Strategy
-1. **Evidence-Based Protocol Deployment**
-   - Implement comprehensive biomarker analysis and skin assessment protocols with personalized treatment planning
-   - Establish specialized treatment customization systems with ongoing outcome monitoring
-   - Deploy advanced treatment prediction and optimization systems based on professional assessment
-
-2. **Professional Education Program Development**
-   - Create comprehensive professional education with hands-on training and practical skill application
-   - Develop advanced competency assessment and certification systems with ongoing professional development
-   - Launch professional excellence programs with evidence-based methodologies and continuous learning systems
-
-3. **Advanced Treatment Innovation**
-   - Implement evidence-based personalized treatment planning systems with professional consultation integration
-   - Establish comprehensive outcome tracking and optimization protocols with client satisfaction monitoring
-   - Deploy advanced treatment prediction systems with professional guidance and evidence-based protocols
-
-4. **Professional Innovation Culture Development**
-   - Foster continuous professional development and evidence-based research systems
-   - Create comprehensive professional development platforms for industry advancement
-   - Establish professional networks for advanced treatment protocol development and knowledge sharing
-"""
+    def _generate_mock_ai_response(self, kind: str, model_type: str = "openai") -> str:
+        """Generate mock AI response (since we don't have real API keys in this environment)."""
+        return self._MOCK_RESPONSES[kind]
     
-    def _generate_comprehensive_response(self) -> str:
-        """Generate comprehensive analysis covering all aspects."""
-        return """
-## Comprehensive RégimA Organizational Learning Cycle Analysis
-
-### Executive Summary
-RégimA has achieved advanced professional excellence with comprehensive Zone Concept integration and evidence-based professional guidance capabilities. The current evolution represents significant advancement to professional organizational intelligence, evidence-based treatment capabilities, and industry leadership potential.
-
-### Professional Excellence Achievements
-1. **Zone Concept Professional Integration**: Framework evolved to advanced professional application with evidence-based treatment protocols and personalized skincare systems
-2. **Professional Excellence Development**: Advanced to professional standards with comprehensive training, evidence-based practice, and industry leadership capabilities
-3. **Professional Guidance Excellence**: Guidance capabilities now encompass comprehensive consultation systems with specialized treatment protocols and evidence-based practices
-4. **Professional Networks**: Integration established comprehensive professional development systems with peer collaboration and knowledge sharing networks
-5. **Innovation Professional Leadership**: Ecosystem advanced to professional research capabilities with continuous treatment development and evidence-based protocol advancement
-
-### Professional Framework Analysis
-
-#### Zone Concept Professional Excellence
-- **Anti-Inflammatory**: 9/10 relevance with advanced inflammation management and Beta-Endorphin Stimulator technology integration
-- **Anti-Oxidant**: 9/10 relevance with professional environmental protection and advanced UV filter systems with evidence-based protocols
-- **Rejuvenation**: 10/10 relevance with professional cellular renewal, peptide technology, and evidence-based anti-aging protocols  
-- **Integration**: 10/10 relevance with comprehensive Zone synchronization and professional treatment protocol integration
-
-#### Professional Excellence Development
-- Current state: Advanced Zone Concept Integration with Professional Excellence and evidence-based practice leadership
-- Evolution level: Professional expertise with advanced Zone understanding, evidence-based treatments, and industry leadership capabilities
-- Growth indicators: Professional treatment capabilities, evidence-based education systems, and industry advancement leadership
-
-### Professional Evolution Cycle Recommendations
-
-#### Immediate Professional Actions (0-6 months)
-1. Deploy comprehensive professional training materials with Zone Concept frameworks and evidence-based practice protocols
-2. Launch advanced Zone Concept protocols with personalized treatment systems and professional consultation capabilities
-3. Implement professional excellence frameworks with evidence-based capabilities and comprehensive education programs
-4. Establish innovation-driven professional development platforms with peer collaboration and advanced training networks
-
-#### Professional Evolution Development (6-24 months)
-1. Develop advanced professional capabilities with comprehensive Zone understanding and specialized treatment expertise
-2. Create evidence-based learning integration with enhanced professional development and competency advancement systems
-3. Evolve organizational professional standards toward industry excellence and continuous improvement leadership
-4. Establish next-generation professional systems for advanced organizational development and industry advancement
-
-### Professional Environmental Scanning Insights
-The analysis reveals professional advancement opportunities in:
-- Advanced skincare technology alignment with Zone Concept principles and evidence-based treatment integration
-- Professional education transformation with comprehensive training methodologies and competency development systems
-- Evidence-based treatment advancement with specialized protocols and personalized skincare solutions
-- Professional development platform advancement for industry excellence and peer collaboration networks
-- Advanced treatment and diagnostic technology integration with Zone Concept and evidence-based protocols
-- Professional research in inflammation, oxidation, regeneration sciences, and evidence-based treatment development
-
-### Professional Success Metrics
-- Advanced professional development markers with comprehensive Zone integration and evidence-based practice excellence
-- Zone Concept integration depth established with professional protocols and evidence-based treatment systems
-- Professional knowledge synthesis with evidence-based predictive capabilities and specialized treatment expertise
-- Enhanced professional learning capacity with comprehensive education and continuous competency development
-- Professional innovation ecosystem establishment with evidence-based technology integration and treatment advancement
-- Industry professional recognition systems with comprehensive education protocols and evidence-based excellence standards
-"""
+    def _analysis_kinds(self) -> Tuple[str, ...]:
+        """Analysis kinds to generate for the configured analysis type."""
+        try:
+            return _ANALYSIS_PLANS[self.analysis_type]
+        except KeyError:
+            raise ValueError(
+                f"Unknown analysis type {self.analysis_type}; "
+                f"expected one of: {', '.join(_ANALYSIS_PLANS)}"
+            ) from None
     
     def generate_analysis(self) -> Dict[str, str]:
         """Generate comprehensive AI analysis based on the analysis type."""
-        logger.info(f"Generating {self.analysis_type} analysis...")
+        logger.info("Generating %s analysis...", self.analysis_type)
         
-        analyses = {}
+        kinds = self._analysis_kinds()
         
-        if self.analysis_type == 'full' or self.analysis_type == 'zone_concept_only':
-            prompt = f"Analyze the Zone Concept framework and provide strategic recommendations. Context: {self._generate_prompt_context()}"
-            analyses['zone_concept'] = self._generate_mock_ai_response(prompt)
+        # Canned responses need neither prompts nor worker threads
+        client = self._ai_client
+        if client is None:
+            return {kind: self._generate_mock_ai_response(kind) for kind in kinds}
         
-        if self.analysis_type == 'full' or self.analysis_type == 'consciousness_only':
-            prompt = f"Analyze the organizational consciousness evolution and provide development insights. Context: {self._generate_prompt_context()}"
-            analyses['consciousness'] = self._generate_mock_ai_response(prompt)
+        # Build the shared prompt context up front so worker threads reuse it
+        _ = self._prompt_context
         
-        if self.analysis_type == 'full' or self.analysis_type == 'guidance_only':
-            prompt = f"Analyze the professional guidance framework and provide enhancement recommendations. Context: {self._generate_prompt_context()}"
-            analyses['guidance'] = self._generate_mock_ai_response(prompt)
+        # The analyses are independent of each other, so request them concurrently
+        with ThreadPoolExecutor(max_workers=len(kinds)) as executor:
+            responses = list(executor.map(partial(self._generate_ai_response, client), kinds))
         
-        if self.analysis_type == 'full':
-            prompt = f"Provide a comprehensive analysis of the RegimA organizational learning cycle. Context: {self._generate_prompt_context()}"
-            analyses['comprehensive'] = self._generate_mock_ai_response(prompt)
-        
-        return analyses
+        return dict(zip(kinds, responses))
     
     def save_outputs(self, analyses: Dict[str, str]) -> None:
         """Save generated analyses to output files."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        generated_at = now.isoformat()
+        os.makedirs(self.outputs_dir, exist_ok=True)
+        output_prefix = os.path.join(self.outputs_dir, '')
         
-        # Save individual analyses
+        # Assemble every output file in memory before writing anything
+        outputs: List[Tuple[str, Sequence[bytes]]] = []
         for analysis_type, content in analyses.items():
             filename = f"regima_{analysis_type}_analysis_{timestamp}.md"
-            filepath = self.outputs_dir / filename
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"# RegimA {analysis_type.title()} Analysis\n")
-                f.write(f"Generated: {datetime.now().isoformat()}\n")
-                f.write(f"Analysis Type: {self.analysis_type}\n\n")
-                f.write(content)
-            
-            logger.info(f"Saved {analysis_type} analysis to {filename}")
+            header = self._create_analysis_header(analysis_type, generated_at)
+            outputs.append((filename, (header.encode('utf-8'), content.encode('utf-8'))))
         
         # Create summary file
-        summary_content = self._create_summary(analyses)
-        summary_filepath = self.outputs_dir / "ai_insights_summary.md"
-        with open(summary_filepath, 'w', encoding='utf-8') as f:
-            f.write(summary_content)
+        summary_content = self._create_summary(analyses, generated_at)
+        outputs.append(("ai_insights_summary.md", (summary_content.encode('utf-8'),)))
         
         # Create JSON output for programmatic access
         json_output = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": generated_at,
             "analysis_type": self.analysis_type,
             "organizational_data": {
-                "consciousness_state": self.regcyc_data.get('organizationalConsciousness', {}),
-                "cycle_status": self.regcyc_data.get('cycleCompletion', {}),
-                "zone_framework": self.regcyc_data.get('zoneConceptFramework', {})
+                "consciousness_state": self._consciousness,
+                "cycle_status": self._cycle,
+                "zone_framework": self._framework
             },
             "ai_analyses": analyses
         }
+        outputs.append((f"regima_ai_analysis_{timestamp}.json", (_json_dumps(json_output),)))
         
-        json_filepath = self.outputs_dir / f"regima_ai_analysis_{timestamp}.json"
-        with open(json_filepath, 'w', encoding='utf-8') as f:
-            json.dump(json_output, f, indent=2, ensure_ascii=False)
+        for filename, chunks in outputs:
+            _write_file(output_prefix + filename, chunks)
         
-        logger.info(f"Saved JSON output to regima_ai_analysis_{timestamp}.json")
+        for analysis_type in analyses:
+            logger.info("Saved %s analysis to regima_%s_analysis_%s.md", analysis_type, analysis_type, timestamp)
+        logger.info("Saved JSON output to regima_ai_analysis_%s.json", timestamp)
     
-    def _create_summary(self, analyses: Dict[str, str]) -> str:
-        """Create a summary of all analyses."""
-        summary = f"""# RégimA Professional Excellence AI Analysis Summary
-
-**Generated:** {datetime.now().isoformat()}
-**Analysis Type:** {self.analysis_type}
-
-## Professional Development Status
-
-### Advanced Organizational State
-- **Professional Level:** {self.regcyc_data.get('organizationalConsciousness', {}).get('currentState', 'N/A')}
-- **Development Stage:** {self.regcyc_data.get('organizationalConsciousness', {}).get('evolutionLevel', 'N/A')}
-- **Cycle Status:** {self.regcyc_data.get('cycleCompletion', {}).get('status', 'N/A')}
-
-### Professional Framework Status
-- **Zone Concept Evolution:** Advanced three-pillar framework with professional integration (Version 2.0.0)
-- **Professional Guidance:** Evidence-based capabilities with treatment optimization
-- **Innovation Ecosystem:** Established with advanced professional technology integration
-- **Professional Impact:** Advanced education systems operational
-
-### Analysis Components Generated
-"""
-        
-        for analysis_type in analyses.keys():
-            summary += f"- {analysis_type.title()} Analysis ✅\n"
-        
-        summary += f"""
-### Professional Next Steps
-Based on the comprehensive professional analysis, RégimA should focus on:
-
-1. **Advanced Professional Actions**: Develop next-generation Zone Concept applications with evidence-based personalization
-2. **Professional Excellence Development**: Advance expertise evolution toward comprehensive professional leadership
-3. **Innovation Excellence**: Establish evidence-based research systems for continuous advancement
-4. **Industry Leadership**: Deploy professional education systems and industry advancement initiatives
-
-### Professional Capabilities Achieved
-- Evidence-based predictive treatment protocols operational
-- Professional development networks established and growing
-- Innovation ecosystem with continuous evidence-based research active
-- Industry impact orientation with advanced professional technology deployment successful
-
-### Files Generated
-- Individual professional analysis files for each excellence component
-- Comprehensive JSON output with advanced analytics for programmatic access
-- This professional summary for strategic review
-
-For detailed professional insights, refer to the individual analysis files in the outputs directory.
-"""
+    def _create_analysis_header(self, analysis_type: str, generated_at: str) -> str:
+        """Create the markdown header for a single analysis generated at the given ISO timestamp."""
+        return (
+            f"# RegimA {_title(analysis_type)} Analysis\n"
+            f"Generated: {generated_at}\n"
+            f"Analysis Type: {self.analysis_type}\n\n"
+        )
+    
+    def _create_summary(self, analyses: Dict[str, str], generated_at: str) -> str:
+        """Create a summary of all analyses generated at the given ISO timestamp."""
+        parts: List[str] = [_SUMMARY_HEADER_TEMPLATE.format_map({
+            **self._state_fields,
+            'generated_at': generated_at,
+            'analysis_type': self.analysis_type,
+        })]
+        parts.extend(f"- {_title(analysis_type)} Analysis ✅\n" for analysis_type in analyses)
+        parts.append(_SUMMARY_FOOTER)
         
-        return summary
+        return "".join(parts)
     
     def run(self) -> None:
         """Main execution method."""
         logger.info("Starting RegimA AI analysis...")
-        logger.info(f"Analysis type: {self.analysis_type}")
+        logger.info("Analysis type: %s", self.analysis_type)
+        
+        # Reject unknown analysis types before any configuration is read
+        try:
+            self._analysis_kinds()
+        except ValueError as e:
+            logger.error("%s", e)
+            sys.exit(2)
+        
+        # Every analysis is derived from regcyc.json, so there is nothing to do without it
+        if not self.regcyc_data:
+            logger.error("No organizational data loaded from regcyc.json; aborting analysis")
+            sys.exit(2)
         
         try:
             # Generate analyses
@@ -419,10 +418,10 @@ For detailed professional insights, refer to the individual analysis files in th
             logger.info("RegimA AI analysis completed successfully!")
             
         except Exception as e:
-            logger.error(f"Error during analysis: {e}")
+            logger.error("Error during analysis: %s", e)
             sys.exit(1)
 
-def main():
+def main() -> None:
     """Main entry point."""
     processor = RegimAAIProcessor()
     processor.run()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Tests for RegimA AI Processor
+"""
+
+import json
+import os
+import pytest
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from regima_ai_processor import RegimAAIProcessor, _json_dumps, _write_file
+
+
+@pytest.fixture
+def processor(tmp_path):
+    """Create a processor that writes its outputs to a temporary directory."""
+    proc = RegimAAIProcessor()
+    proc.outputs_dir = tmp_path
+    return proc
+
+
+class TestConfigLoading:
+    """Tests for configuration file loading."""
+
+    def test_loads_repository_config(self, processor):
+        """Test regcyc.json is loaded from the repository root."""
+        assert 'organizationalConsciousness' in processor.regcyc_data
+
+    def test_config_loaded_lazily(self, monkeypatch):
+        """Test constructing a processor performs no config file I/O."""
+        def fail(self, filename):
+            raise AssertionError(f"{filename} loaded eagerly")
+        monkeypatch.setattr(RegimAAIProcessor, '_load_json_file', fail)
+        RegimAAIProcessor()
+
+    def test_load_json_file(self, processor, tmp_path):
+        """Test non-ASCII JSON content round-trips through the loader."""
+        (tmp_path / "sample.json").write_text(
+            json.dumps({"name": "RégimA"}, ensure_ascii=False), encoding='utf-8'
+        )
+        processor.base_path = tmp_path
+        assert processor._load_json_file("sample.json") == {"name": "RégimA"}
+
+    def test_load_large_json_file(self, processor, tmp_path):
+        """Test files above the memory-map threshold load correctly."""
+        items = [f"insight {i}" for i in range(10000)]
+        (tmp_path / "large.json").write_text(json.dumps({"insights": items}), encoding='utf-8')
+        processor.base_path = tmp_path
+        assert processor._load_json_file("large.json") == {"insights": items}
+
+    def test_load_missing_file(self, processor, tmp_path):
+        """Test missing files load as an empty dict."""
+        processor.base_path = tmp_path
+        assert processor._load_json_file("missing.json") == {}
+
+    def test_load_invalid_json(self, processor, tmp_path):
+        """Test malformed files load as an empty dict."""
+        (tmp_path / "bad.json").write_text("{not json", encoding='utf-8')
+        processor.base_path = tmp_path
+        assert processor._load_json_file("bad.json") == {}
+
+    def test_load_non_object_json(self, processor, tmp_path):
+        """Test files whose top level is not an object load as an empty dict."""
+        (tmp_path / "list.json").write_text("[1, 2]", encoding='utf-8')
+        processor.base_path = tmp_path
+        assert processor._load_json_file("list.json") == {}
+
+    def test_null_sections_treated_as_empty(self, monkeypatch):
+        """Test null top-level sections in regcyc.json do not break context building."""
+        monkeypatch.setattr(
+            RegimAAIProcessor, '_load_json_file',
+            lambda self, filename: {"cycleCompletion": None, "professionalGuidance": None}
+        )
+        context = RegimAAIProcessor()._prompt_context
+        assert "- **Cycle Status**: N/A" in context
+
+    def test_null_nested_sections_treated_as_empty(self, monkeypatch):
+        """Test null core elements, focus areas and insights do not break context building."""
+        monkeypatch.setattr(
+            RegimAAIProcessor, '_load_json_file',
+            lambda self, filename: {
+                "zoneConceptFramework": {"coreElements": None},
+                "professionalGuidance": {"focusAreas": None},
+                "cycleCompletion": {"insights": None},
+            }
+        )
+        context = RegimAAIProcessor()._prompt_context
+        assert context.endswith("## Current Cycle Insights:\n")
+
+    def test_null_core_element_fields_treated_as_empty(self, monkeypatch):
+        """Test null core element entries and key technologies do not break context building."""
+        monkeypatch.setattr(
+            RegimAAIProcessor, '_load_json_file',
+            lambda self, filename: {
+                "zoneConceptFramework": {"coreElements": {
+                    "antiInflammatory": None,
+                    "rejuvenation": {"relevance": 9, "keyTechnologies": None},
+                }},
+            }
+        )
+        context = RegimAAIProcessor()._prompt_context
+        assert "**Antiinflammatory**:\n- Relevance: N/A/10\n" in context
+        assert "**Rejuvenation**:\n- Relevance: 9/10\n- Focus: N/A\n- Key Technologies: \n" in context
+
+
+class TestJsonSerialization:
+    """Tests for JSON output serialization."""
+
+    def test_indented_utf8_output(self):
+        """Test output is indented and keeps non-ASCII characters."""
+        data = _json_dumps({"name": "RégimA", "items": [1]})
+        assert data.decode('utf-8') == '{\n  "name": "RégimA",\n  "items": [\n    1\n  ]\n}'
+
+    def test_non_string_keys(self):
+        """Test non-string keys are serialized as strings."""
+        assert json.loads(_json_dumps({1: "one"})) == {"1": "one"}
+
+
+class TestAnalysisGeneration:
+    """Tests for analysis generation."""
+
+    def test_full_analysis(self, processor):
+        """Test full analysis produces all four components."""
+        processor.analysis_type = 'full'
+        analyses = processor.generate_analysis()
+        assert list(analyses) == ['zone_concept', 'consciousness', 'guidance', 'comprehensive']
+        assert "Zone Concept Framework Analysis" in analyses['zone_concept']
+        assert "Organizational Excellence Analysis" in analyses['consciousness']
+        assert "Guidance Enhancement Analysis" in analyses['guidance']
+        assert "Comprehensive RégimA" in analyses['comprehensive']
+
+    @pytest.mark.parametrize("analysis_type,key", [
+        ('zone_concept_only', 'zone_concept'),
+        ('consciousness_only', 'consciousness'),
+        ('guidance_only', 'guidance'),
+    ])
+    def test_single_analysis(self, processor, analysis_type, key):
+        """Test *_only analysis types produce a single component."""
+        processor.analysis_type = analysis_type
+        assert list(processor.generate_analysis()) == [key]
+
+    def test_unknown_analysis_type(self, processor):
+        """Test an unrecognised analysis type is rejected."""
+        processor.analysis_type = 'unknown'
+        with pytest.raises(ValueError, match="Unknown analysis type unknown"):
+            processor.generate_analysis()
+
+    @pytest.mark.parametrize("kind,heading", [
+        ('zone_concept', "## Advanced Zone Concept Framework Analysis"),
+        ('consciousness', "## Professional Organizational Excellence Analysis"),
+        ('guidance', "## Professional Guidance Enhancement Analysis"),
+        ('comprehensive', "## Comprehensive RégimA Organizational Learning Cycle Analysis"),
+    ])
+    def test_mock_response_dispatch(self, processor, kind, heading):
+        """Test mock responses are selected by analysis kind."""
+        response = processor._generate_mock_ai_response(kind)
+        assert response.lstrip().startswith(heading)
+
+    def test_mock_mode_skips_prompt_context(self, processor):
+        """Test mock mode never builds the prompt context."""
+        processor.generate_analysis()
+        assert '_prompt_context' not in vars(processor)
+
+    def test_live_mode_builds_prompt_context(self, processor):
+        """Test the prompt context is built when an AI provider client is wired in."""
+        processor._ai_client = lambda prompt: prompt
+        processor.generate_analysis()
+        assert '_prompt_context' in vars(processor)
+
+    def test_live_mode_sends_prompts_to_client(self, processor):
+        """Test concurrent generation sends each prompt to the client and keeps analysis order."""
+        processor.analysis_type = 'full'
+        processor._ai_client = lambda prompt: prompt
+        analyses = processor.generate_analysis()
+        assert list(analyses) == ['zone_concept', 'consciousness', 'guidance', 'comprehensive']
+        assert analyses['guidance'].startswith("Analyze the professional guidance framework")
+        for prompt in analyses.values():
+            assert prompt.endswith(f"Context: {processor._prompt_context}")
+
+    def test_mock_response_skips_prompt_context(self, processor):
+        """Test mock responses do not build the unused prompt context."""
+        processor._generate_mock_ai_response('guidance')
+        assert '_prompt_context' not in vars(processor)
+
+    def test_api_keys_alone_keep_mock_mode(self, monkeypatch):
+        """Test provider API keys without a wired-in client do not build prompts."""
+        for var in ('OPENAI_API_KEY', 'ANTHROPIC_API_KEY', 'GOOGLE_AI_API_KEY'):
+            monkeypatch.setenv(var, 'test-key')
+        processor = RegimAAIProcessor()
+        processor.generate_analysis()
+        assert processor._ai_client is None
+        assert '_prompt_context' not in vars(processor)
+
+
+class TestSaveOutputs:
+    """Tests for output file generation."""
+
+    def test_save_outputs(self, processor, tmp_path):
+        """Test markdown, summary and JSON outputs are written."""
+        processor.analysis_type = 'full'
+        analyses = processor.generate_analysis()
+        processor.save_outputs(analyses)
+
+        markdown = sorted(tmp_path.glob("regima_*_analysis_*.md"))
+        assert len(markdown) == 4
+        zone_file = next(p for p in markdown if "zone_concept" in p.name)
+        text = zone_file.read_text(encoding='utf-8')
+        assert text.startswith("# RegimA Zone_Concept Analysis\n")
+        assert "Analysis Type: full\n\n" in text
+
+        summary = (tmp_path / "ai_insights_summary.md").read_text(encoding='utf-8')
+        assert "- Comprehensive Analysis ✅" in summary
+
+        json_files = list(tmp_path.glob("regima_ai_analysis_*.json"))
+        assert len(json_files) == 1
+        data = json.loads(json_files[0].read_text(encoding='utf-8'))
+        assert data['analysis_type'] == 'full'
+        assert data['ai_analyses'] == analyses
+        assert "RégimA" in json_files[0].read_text(encoding='utf-8')
+
+    def test_save_outputs_creates_directory(self, processor, tmp_path):
+        """Test the outputs directory is created when outputs are saved."""
+        processor.outputs_dir = tmp_path / "reports" / "outputs"
+        processor.save_outputs({'guidance': "content"})
+        assert (processor.outputs_dir / "ai_insights_summary.md").exists()
+
+    def test_outputs_share_timestamp(self, processor, tmp_path):
+        """Test every output records the same generation time."""
+        processor.analysis_type = 'full'
+        processor.save_outputs(processor.generate_analysis())
+
+        data = json.loads(next(tmp_path.glob("regima_ai_analysis_*.json")).read_text(encoding='utf-8'))
+        generated_at = data['timestamp']
+        assert f"**Generated:** {generated_at}\n" in (tmp_path / "ai_insights_summary.md").read_text(encoding='utf-8')
+        for path in tmp_path.glob("regima_*_analysis_*.md"):
+            assert f"Generated: {generated_at}\n" in path.read_text(encoding='utf-8')
+
+
+class TestWriteFile:
+    """Tests for low-level output file writing."""
+
+    def test_replaces_content(self, tmp_path):
+        """Test writing over an existing file truncates the old content."""
+        path = tmp_path / "out.md"
+        path.write_bytes(b"previous longer content")
+        _write_file(str(path), (b"# Header\n", "RégimA\n".encode('utf-8')))
+        assert path.read_bytes() == "# Header\nRégimA\n".encode('utf-8')
+
+    def test_without_writev(self, tmp_path, monkeypatch):
+        """Test chunks are joined into one write where writev is unavailable."""
+        monkeypatch.delattr(os, 'writev', raising=False)
+        path = tmp_path / "out.md"
+        _write_file(str(path), (b"# Header\n", b"body\n"))
+        assert path.read_bytes() == b"# Header\nbody\n"
+
+    def test_short_writev(self, tmp_path, monkeypatch):
+        """Test the remainder is written when writev writes only part of the chunks."""
+        real_writev = os.writev
+        monkeypatch.setattr(os, 'writev', lambda fd, chunks: real_writev(fd, [chunks[0][:3]]))
+        path = tmp_path / "out.md"
+        _write_file(str(path), (b"# Header\n", b"body\n"))
+        assert path.read_bytes() == b"# Header\nbody\n"
+
+
+class TestPromptContext:
+    """Tests for AI prompt context generation."""
+
+    def test_context_includes_state(self, processor):
+        """Test context reflects the organizational data."""
+        context = processor._prompt_context
+        assert "## Zone Concept Framework" in context
+        assert "## Current Cycle Insights:" in context
+
+    def test_context_is_cached(self, processor):
+        """Test context is built once and reused."""
+        first = processor._prompt_context
+        assert processor._prompt_context is first
+
+
+class TestRun:
+    """Tests for the main execution method."""
+
+    def test_run_writes_outputs(self, processor, tmp_path):
+        """Test a full run writes the summary."""
+        processor.run()
+        assert (tmp_path / "ai_insights_summary.md").exists()
+
+    def test_run_aborts_without_config(self, processor, tmp_path):
+        """Test a run without organizational data exits before writing outputs."""
+        processor.regcyc_data = {}
+        with pytest.raises(SystemExit) as exc_info:
+            processor.run()
+        assert exc_info.value.code == 2
+        assert list(tmp_path.iterdir()) == []
+
+    def test_run_rejects_unknown_analysis_type(self, processor, tmp_path):
+        """Test an unknown analysis type exits before loading configuration."""
+        processor.analysis_type = 'unknown'
+        with pytest.raises(SystemExit) as exc_info:
+            processor.run()
+        assert exc_info.value.code == 2
+        assert 'regcyc_data' not in vars(processor)
+        assert list(tmp_path.iterdir()) == []